@@ -0,0 +1,18 @@
+# canonical import path for the AWS CLI classes - there is exactly one
+# aws_cli module, so EC2CLI/AWSConfig resolve the same way regardless of
+# how callers import them
+from aws.aws_cli import (
+    AWSConfig,
+    AutoScalingConfig,
+    AWSCLIBase,
+    EC2CLI,
+    EC2InstanceConfig,
+)
+
+__all__ = [
+    "AWSConfig",
+    "AutoScalingConfig",
+    "AWSCLIBase",
+    "EC2CLI",
+    "EC2InstanceConfig",
+]
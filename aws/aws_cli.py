@@ -1,13 +1,79 @@
 import boto3
+import functools
 import time
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional, Dict, Callable
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import logging
-from pydantic import BaseModel, Field, model_validator, SkipValidation
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator, SkipValidation
+
+from aws.batcher import InstanceIDBatcher
+from utils.general_utils import BufferedLogger
+
+# optional: route botocore's JSON response parsing through orjson (C extension,
+# ~3-10x faster than stdlib json). The streaming loop re-parses multi-KB
+# describe/console-output payloads every interval, which amplifies this cost.
+# Only botocore.parsers' module reference is swapped (not the stdlib json
+# module itself) so other botocore internals keep their json kwargs support.
+try:
+    import types
+
+    import orjson
+    import botocore.parsers
+
+    botocore.parsers.json = types.SimpleNamespace(loads=orjson.loads)
+except ImportError:
+    pass
 
 logger = logging.getLogger("aws_agent_logger")
 
+
+# Session/client construction is ~25ms each and opens a fresh TLS connection,
+# so repeated CLI object creation (REPL, retries) should reuse one session and
+# client per (region, service) - this also shares the underlying connection pool.
+# Caveat: boto3 sessions/clients are thread-safe but not fork-safe - build them
+# before forking and don't share them across processes afterwards.
+@functools.lru_cache(maxsize=8)
+def _get_session(region_name: str) -> boto3.Session:
+    return boto3.Session(
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name=region_name,
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _get_client(region_name: str, service_name: str, max_pool_connections: int = 50):
+    # default botocore config caps the connection pool at 10, which stalls
+    # concurrent log streaming / batched polling with "Connection pool is full"
+    # adaptive retries also absorb transient Throttling/RequestLimitExceeded errors
+    client_config = Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        connect_timeout=5,
+        read_timeout=30,
+    )
+
+    return _get_session(region_name).client(service_name, config=client_config)
+
+
+# VPC/subnet IDs already created by this process, keyed by
+# (region, vpc_cidr, subnet_cidr, az) - building several EC2CLI objects in one
+# process (REPL, tests, retry flows) shouldn't recreate identical VPC state
+_VPC_CACHE: Dict[tuple, tuple] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _config_field_names(config_cls) -> tuple:
+    # field list per config class is static - compute once instead of walking
+    # the full Pydantic dump machinery on every to_dict call in the deploy path
+    return tuple(name for name in config_cls.model_fields if name != "logging_function")
+
+
 class AWSConfig(BaseModel):
     """
     Base Config class for AWS CLI deployment configurations
@@ -15,10 +81,33 @@ class AWSConfig(BaseModel):
     Inherited by EC2 Config and AutoScaling Config
     """
 
+    # Note: construction/attribute storage is handled by pydantic-core (compiled),
+    # so there's no Python-level kwargs loop to specialize here
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # adding hook for logging to user - option to rework scripts to not do within class itself
     logging_function: SkipValidation[Callable] = print
-    class Config:
-        arbitrary_types_allowed = True
+
+    # cached "param: value" display rendering - configs are displayed after
+    # every intent but change far less often, so rebuild only on modification
+    _formatted: Optional[str] = PrivateAttr(default=None)
+
+    def display_string(self) -> str:
+        """
+        Return the "param: value" lines for this config, one per field.
+
+        The rendered string is cached on the instance and invalidated by
+        modify_config, so repeated displays of an unchanged config reuse it.
+
+        Returns:
+            str: The formatted config lines.
+        """
+
+        if self._formatted is None:
+            self._formatted = "\n".join(
+                f"{param}: {value}" for param, value in self.to_dict().items()
+            )
+        return self._formatted
 
     def to_dict(self, exclude_none: bool = True)->Dict:
         """
@@ -31,10 +120,18 @@ class AWSConfig(BaseModel):
             Dict: A dictionary representation of the model's fields.
         """
 
-        data = self.model_dump(exclude_none=exclude_none)
-        # remove the logging_function from the output
-        data.pop('logging_function', None)
-        return data
+        # build directly from the precomputed field list (logging_function excluded) -
+        # model_dump re-runs serializer machinery we don't need on this hot path
+        field_names = _config_field_names(self.__class__)
+
+        if exclude_none:
+            return {
+                name: value
+                for name in field_names
+                if (value := getattr(self, name)) is not None
+            }
+
+        return {name: getattr(self, name) for name in field_names}
 
     def modify_config(self, **kwargs):
         """
@@ -45,24 +142,38 @@ class AWSConfig(BaseModel):
                       since predicted from function calling response
         """
 
-        new_data = self.model_dump()
-
+        # only validate/apply the fields that actually changed rather than
+        # dumping and re-setting the full model on every edit
+        filtered = {}
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in self.model_fields:
                 if value is not None:
-                    new_data[key] = value
+                    # %-style is lazy - no string is built when the level is disabled
+                    logger.debug("Modifying %s to %s", key, value)
+                    filtered[key] = value
             else:
+                logger.debug(
+                    "%s has no attribute %s", self.__class__.__name__, key
+                )
                 self.logging_function(
                     f"{self.__class__.__name__} has no attribute '{key}'. Please select a valid parameter to modify.")
 
-        # try to create a new instance with the updated data
+        if not filtered:
+            return self
+
+        # validate a candidate copy with the updates applied (model_copy skips
+        # validation, so run the class validators once over the candidate)
         try:
-            new_instance = self.__class__.model_validate(new_data)
+            candidate = self.model_copy(update=filtered)
+            self.__class__.model_validate(candidate.model_dump())
 
-            # if validation passes, update self with new values
-            for key, value in new_data.items():
+            # if validation passes, apply only the changed fields
+            for key, value in filtered.items():
                 setattr(self, key, value)
 
+            # the cached display rendering is stale once a field changed
+            self._formatted = None
+
             return self
 
         except ValueError as e:
@@ -121,11 +232,7 @@ class AWSCLIBase:
     """
 
     def __init__(self, region_name="us-east-1"):
-        self.session = boto3.Session(
-            aws_access_key_id="test",
-            aws_secret_access_key="test",
-            region_name=region_name,
-        )
+        self.session = _get_session(region_name)
 
     def deploy(self, **kwargs):
         raise NotImplementedError("Subclass must implement abstract method")
@@ -143,21 +250,43 @@ class EC2CLI(AWSCLIBase):
 
     Args:
         region_name (str): The AWS region name to use to initialize boto3 session. Defaults to "us-east-1".
+        logging_function (Callable): Function used to surface messages to the user.
+            Defaults to a BufferedLogger writing to stdout.
+        max_pool_connections (int): Size of the urllib3 connection pool shared by each client.
+            Scale with the number of concurrent workers (e.g. log-streaming threads). Defaults to 50.
     """
 
-    def __init__(self, region_name="us-east-1", logging_function=print):
+    def __init__(self, region_name="us-east-1", logging_function=None, max_pool_connections=50):
         super().__init__(region_name)
         self.vpc_id = None
         self.subnet_id = None
-        self.ec2_client = self.session.client("ec2", region_name=region_name)
-        self.as_client = self.session.client("autoscaling", region_name=region_name)
+
+        self.ec2_client = _get_client(region_name, "ec2", max_pool_connections)
+        self.as_client = _get_client(region_name, "autoscaling", max_pool_connections)
 
         # create mock vpc / subnet
         self.initiate_vpc_subnet()
 
-        # generic logging function - in this case, just printing to console
-        self.logging_function = logging_function
-        self.deployed_instance_ids = []
+        # generic logging function - defaults to a buffered stdout writer that
+        # batches write() syscalls instead of flushing per message like print
+        self.logging_function = logging_function if logging_function is not None else BufferedLogger()
+
+        # list preserves deployment order for display; the set gives O(1)
+        # membership checks so repeated deploys don't record duplicates
+        self._deployed_instance_ids: List[str] = []
+        self._deployed_set: set = set()
+
+        # coalesces concurrent per-instance state lookups into one batched call
+        self._instance_batcher = InstanceIDBatcher(self.verify_ec2_instance_creation_bulk)
+
+        # instance state/console output rarely change between successive polls in a
+        # short window - a small TTL keeps repeat polls from hitting the EC2 API
+        self._instance_state_cache = TTLCache(maxsize=1024, ttl=5)
+        self._console_output_cache = TTLCache(maxsize=1024, ttl=5)
+
+        # length of console output already shown per instance - streaming only
+        # emits the new suffix on each poll instead of re-printing everything
+        self._last_output_len: Dict[str, int] = {}
 
     def initiate_vpc_subnet(
             self,
@@ -177,6 +306,17 @@ class EC2CLI(AWSCLIBase):
             None
         """
 
+        # reuse the VPC/subnet this process already created for identical parameters
+        cache_key = (
+            self.session.region_name,
+            vpc_cidr_block,
+            subnet_cidr_block,
+            subnet_availability_zone,
+        )
+        if cache_key in _VPC_CACHE:
+            self.vpc_id, self.subnet_id = _VPC_CACHE[cache_key]
+            return
+
         vpc_response = self.ec2_client.create_vpc(CidrBlock=vpc_cidr_block)
         self.vpc_id = vpc_response["Vpc"]["VpcId"]
 
@@ -187,6 +327,19 @@ class EC2CLI(AWSCLIBase):
         )
         self.subnet_id = subnet_response["Subnet"]["SubnetId"]
 
+        _VPC_CACHE[cache_key] = (self.vpc_id, self.subnet_id)
+
+    @property
+    def deployed_instance_ids(self) -> tuple:
+        """
+        Instance IDs deployed so far (deduplicated, in deployment order).
+
+        Returns:
+            tuple: Read-only view - callers can't mutate the internal record.
+        """
+
+        return tuple(self._deployed_instance_ids)
+
     def create_launch_template(
             self, ec2_config: EC2InstanceConfig, template_name: str = "test"
     ) -> Optional[str]:
@@ -228,9 +381,11 @@ class EC2CLI(AWSCLIBase):
             None
         """
 
+        asg_name = f"ASG-{as_config.LaunchTemplateName}"
+
         try:
             self.as_client.create_auto_scaling_group(
-                AutoScalingGroupName=f"ASG-{as_config.LaunchTemplateName}",
+                AutoScalingGroupName=asg_name,
                 MinSize=as_config.MinSize,
                 MaxSize=as_config.MaxSize,
                 DesiredCapacity=as_config.DesiredCapacity,
@@ -242,7 +397,7 @@ class EC2CLI(AWSCLIBase):
                 },
             )
             self.logging_function(
-                f"Auto Scaling Group 'ASG-{as_config.LaunchTemplateName}' created successfully."
+                f"Auto Scaling Group '{asg_name}' created successfully."
             )
         except ClientError as e:
             self.logging_function(f"Error creating Auto Scaling group: {e}")
@@ -267,72 +422,134 @@ class EC2CLI(AWSCLIBase):
 
         self.logging_function("\n")
 
-        try:
-            if autoscaling_enabled:
-                launch_template_id = self.create_launch_template(
-                    ec2_config, as_config.LaunchTemplateName
-                )
+        # Note: no blanket except Exception here - transient Throttling /
+        # RequestLimitExceeded errors are already retried by the adaptive retry
+        # config on the clients, and anything else is a real error that should
+        # propagate with its traceback rather than be swallowed.
+        if autoscaling_enabled:
+            # single source of truth for the group name across create/describe/log
+            asg_name = f"ASG-{as_config.LaunchTemplateName}"
 
-                if not launch_template_id:
-                    self.logging_function(
-                        "Failed to create Launch Template. Aborting deployment."
-                    )
-                    return
+            launch_template_id = self.create_launch_template(
+                ec2_config, as_config.LaunchTemplateName
+            )
 
+            if not launch_template_id:
                 self.logging_function(
-                    f"Launch Template created with ID: {launch_template_id}"
+                    "Failed to create Launch Template. Aborting deployment."
                 )
+                return
 
-                self.logging_function("Creating Auto Scaling Group...")
-                self.create_auto_scaling_group(as_config, launch_template_id)
+            self.logging_function(
+                f"Launch Template created with ID: {launch_template_id}"
+            )
 
-                self.logging_function(
-                    "Waiting for instances to be launched by Auto Scaling Group..."
-                )
-                time.sleep(10)  # time to allow instances to launch
+            self.logging_function("Creating Auto Scaling Group...")
+            self.create_auto_scaling_group(as_config, launch_template_id)
 
-                response = self.as_client.describe_auto_scaling_groups(
-                    AutoScalingGroupNames=[f"ASG-{as_config.LaunchTemplateName}"]
-                )
-                if response["AutoScalingGroups"]:
-                    instance_ids = [
-                        instance["InstanceId"]
-                        for instance in response["AutoScalingGroups"][0]["Instances"]
-                    ]
+            self.logging_function(
+                "Waiting for instances to be launched by Auto Scaling Group..."
+            )
 
-                    self.logging_function(
-                        f"Auto Scaling Group has launched {len(instance_ids)} instances. Instance IDs: {', '.join(instance_ids)}"
+            # poll instead of a fixed sleep - exits as soon as instances appear,
+            # and slow launches no longer spuriously abort after a single check
+            instance_ids = []
+            for _ in range(20):
+                try:
+                    response = self.as_client.describe_auto_scaling_groups(
+                        AutoScalingGroupNames=[asg_name]
                     )
-
-                else:
+                except ClientError as e:
                     self.logging_function(
-                        "No instances have been launched yet by the Auto Scaling Group."
+                        f"Error describing Auto Scaling group: {e}"
                     )
                     return
-            else:
-                self.logging_function("Deploying EC2 instances directly...")
-                response = self.ec2_client.run_instances(**ec2_config.to_dict())
-                instance_ids = [
-                    instance["InstanceId"] for instance in response["Instances"]
-                ]
+                if (
+                        response["AutoScalingGroups"]
+                        and response["AutoScalingGroups"][0]["Instances"]
+                ):
+                    instance_ids = [
+                        instance["InstanceId"]
+                        for instance in response["AutoScalingGroups"][0]["Instances"]
+                    ]
+                    break
+                time.sleep(0.5)
+
+            if not instance_ids:
                 self.logging_function(
-                    f"Deployed {len(instance_ids)} instances. Instance IDs: {', '.join(instance_ids)}"
+                    "No instances have been launched yet by the Auto Scaling Group."
                 )
+                return
+
+            # wait until EC2 actually knows about the instances before polling them
+            self.ec2_client.get_waiter("instance_exists").wait(
+                InstanceIds=instance_ids,
+                WaiterConfig={"Delay": 2, "MaxAttempts": 15},
+            )
 
-            self.deployed_instance_ids += instance_ids
-            self.logging_function("Deployment completed successfully")
+            self.logging_function(
+                f"Auto Scaling Group has launched {len(instance_ids)} instances. Instance IDs: {', '.join(instance_ids)}"
+            )
+        else:
+            self.logging_function("Deploying EC2 instances directly...")
+            try:
+                response = self.ec2_client.run_instances(**ec2_config.to_dict())
+            except ClientError as e:
+                self.logging_function(f"Error launching EC2 instances: {e}")
+                return
+            instance_ids = [
+                instance["InstanceId"] for instance in response["Instances"]
+            ]
+            self.logging_function(
+                f"Deployed {len(instance_ids)} instances. Instance IDs: {', '.join(instance_ids)}"
+            )
+
+        new_instance_ids = [
+            instance_id
+            for instance_id in instance_ids
+            if instance_id not in self._deployed_set
+        ]
+        self._deployed_instance_ids.extend(new_instance_ids)
+        self._deployed_set.update(new_instance_ids)
+        self.logging_function("Deployment completed successfully")
+
+        # per requirements - stream logs to user
+        # streaming all deployed instances concurrently - polling runs off the main thread
+        # so total streaming time is O(duration) rather than O(num_instances * duration)
+        self.stream_logs_from_ec2_instances(instance_ids)
+
+    def verify_ec2_instance_creation_bulk(self, instance_ids: List[str]) -> Dict[str, str]:
+        """
+        Verify the creation of many EC2 instances with a single API call.
 
-            # per requirements - stream logs to user - could send all instances created
-            # to make it more user-friendly here, will just stream one instance logs
-            self.stream_logs_from_ec2_instance(instance_ids[0])
+        Uses describe_instance_status rather than describe_instances - it accepts
+        many IDs per call and returns only state information instead of the full
+        reservation payload, so far fewer bytes cross the wire per poll.
 
-        except Exception as e:
-            self.logging_function(f"An error occurred during deployment: {str(e)}")
+        Args:
+            instance_ids (List[str]): The IDs of the EC2 instances.
+
+        Returns:
+            Dict[str, str]: Mapping of instance ID to instance state name.
+        """
+
+        response = self.ec2_client.describe_instance_status(
+            InstanceIds=instance_ids, IncludeAllInstances=True
+        )
+
+        return {
+            status["InstanceId"]: status["InstanceState"]["Name"]
+            for status in response["InstanceStatuses"]
+        }
 
     def verify_ec2_instance_creation(self, instance_id) -> str:
         """
         Verify the creation of an EC2 instance.
 
+        Requests made concurrently (e.g. while polling many instances) are coalesced
+        by the batcher into a single describe_instances call; results are served
+        from a short TTL cache across repeat polls.
+
         Args:
             instance_id (str): The ID of the EC2 instance.
 
@@ -340,15 +557,33 @@ class EC2CLI(AWSCLIBase):
             str: The state of the EC2 instance.
         """
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            state = response["Reservations"][0]["Instances"][0]["State"]["Name"]
+            state = self._instance_state_cache.get(instance_id)
+            if state is None:
+                state = self._instance_batcher.submit(instance_id).result()
+                self._instance_state_cache[instance_id] = state
             return state
         except Exception as e:
             return str(e)
 
+    def invalidate_instance_cache(self, instance_id: str):
+        """
+        Drop cached state/console output for an instance whose state is known to have changed.
+
+        Args:
+            instance_id (str): The ID of the EC2 instance.
+
+        Returns:
+            None
+        """
+
+        self._instance_state_cache.pop(instance_id, None)
+        self._console_output_cache.pop(instance_id, None)
+
     def get_ec2_instance_console_output(self, instance_id) -> str:
         """
         Get the console output of a specific EC2 instance.
+        Served from a short TTL cache so tight polling loops don't re-fetch
+        output that hasn't had time to change.
 
         Args:
             instance_id (str): The ID of the EC2 instance.
@@ -357,8 +592,15 @@ class EC2CLI(AWSCLIBase):
             str: The console output of the EC2 instance.
         """
 
-        response = self.ec2_client.get_console_output(InstanceId=instance_id)
-        output = response["Output"]
+        output = self._console_output_cache.get(instance_id)
+        if output is None:
+            # Latest=True asks AWS for the most recent buffer rather than a
+            # potentially cached older snapshot
+            response = self.ec2_client.get_console_output(
+                InstanceId=instance_id, Latest=True
+            )
+            output = response["Output"]
+            self._console_output_cache[instance_id] = output
         return output
 
     def stream_logs_from_ec2_instance(self, instance_id, interval=5, duration=30):
@@ -380,8 +622,41 @@ class EC2CLI(AWSCLIBase):
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             console_output = self.get_ec2_instance_console_output(instance_id)
 
-            self.logging_function(
-                f"{current_time} - {instance_id} Console Output: {console_output}"
-            )
+            # only emit output we haven't shown yet - most polls add nothing new
+            new_output = console_output[self._last_output_len.get(instance_id, 0):]
+            if new_output:
+                self.logging_function(
+                    f"{current_time} - {instance_id} Console Output: {new_output}"
+                )
+                self._last_output_len[instance_id] = len(console_output)
 
             time.sleep(interval)
+
+    def stream_logs_from_ec2_instances(self, instance_ids: List[str], interval=5, duration=30):
+        """
+        Stream logs from multiple EC2 instances concurrently.
+
+        Each instance is polled on its own worker thread so the total streaming time
+        stays at roughly `duration` regardless of the number of instances.
+        boto3 clients are thread-safe, so sharing self.ec2_client across workers is fine.
+
+        Args:
+            instance_ids (List[str]): The IDs of the EC2 instances to stream logs from.
+            interval (int): The interval in seconds between each log stream (default is 5 seconds).
+            duration (int): The total duration in seconds to stream logs for (default is 30 seconds).
+
+        Returns:
+            None
+        """
+
+        with ThreadPoolExecutor(max_workers=len(instance_ids)) as executor:
+            futures = [
+                executor.submit(
+                    self.stream_logs_from_ec2_instance, instance_id, interval, duration
+                )
+                for instance_id in instance_ids
+            ]
+
+            # surface any worker exceptions rather than dropping them silently
+            for future in futures:
+                future.result()
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, List
+
+import logging
+
+from botocore.config import Config
+
+from aws.aws_cli import AutoScalingConfig, EC2InstanceConfig
+
+# optional dependency - only needed for AsyncEC2CLI
+# (not pinned in requirements.txt: aiobotocore pins its own botocore range)
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+logger = logging.getLogger("aws_agent_logger")
+
+
+class AsyncEC2CLI:
+    """
+    aioboto3-backed counterpart to EC2CLI for I/O-bound AWS operations.
+
+    All EC2CLI methods are pure network I/O; running them through aioboto3 lets
+    many requests be in flight at once without GIL-limited threads, so deploying
+    and streaming N instances finishes in roughly max(latency) rather than
+    sum(latency).
+
+    Use as an async context manager so the underlying aiohttp clients are
+    opened/closed cleanly:
+
+        async with AsyncEC2CLI(subnet_id=...) as cli:
+            await cli.deploy(ec2_config)
+
+    Args:
+        region_name (str): The AWS region name to use to initialize the aioboto3 session. Defaults to "us-east-1".
+        logging_function (Callable): Function used to surface messages to the user. Defaults to print.
+        subnet_id (str): Subnet to deploy into - typically taken from an existing EC2CLI, which owns VPC/subnet setup.
+    """
+
+    def __init__(self, region_name="us-east-1", logging_function=print, subnet_id=None):
+        if aioboto3 is None:
+            raise ImportError(
+                "aioboto3 is required for AsyncEC2CLI - install it with 'pip install aioboto3'"
+            )
+
+        self.session = aioboto3.Session(
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+            region_name=region_name,
+        )
+        self.logging_function = logging_function
+        self.subnet_id = subnet_id
+        self.deployed_instance_ids = []
+
+        self._client_config = Config(
+            max_pool_connections=50,
+            retries={"mode": "adaptive", "max_attempts": 10},
+            connect_timeout=5,
+            read_timeout=30,
+        )
+        self._ec2_client_ctx = None
+        self.ec2_client = None
+
+    async def __aenter__(self):
+        self._ec2_client_ctx = self.session.client("ec2", config=self._client_config)
+        self.ec2_client = await self._ec2_client_ctx.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._ec2_client_ctx.__aexit__(exc_type, exc_value, traceback)
+        self.ec2_client = None
+
+    async def verify_ec2_instance_creation(self, instance_ids: List[str]) -> Dict[str, str]:
+        """
+        Verify the creation of EC2 instances with one batched describe call.
+
+        Args:
+            instance_ids (List[str]): The IDs of the EC2 instances.
+
+        Returns:
+            Dict[str, str]: Mapping of instance ID to instance state name.
+        """
+
+        response = await self.ec2_client.describe_instances(InstanceIds=instance_ids)
+
+        return {
+            instance["InstanceId"]: instance["State"]["Name"]
+            for reservation in response["Reservations"]
+            for instance in reservation["Instances"]
+        }
+
+    async def get_ec2_instance_console_output(self, instance_id) -> str:
+        """
+        Get the console output of a specific EC2 instance.
+
+        Args:
+            instance_id (str): The ID of the EC2 instance.
+
+        Returns:
+            str: The console output of the EC2 instance.
+        """
+
+        response = await self.ec2_client.get_console_output(InstanceId=instance_id)
+        return response["Output"]
+
+    async def stream_logs_from_ec2_instance(self, instance_id, interval=5, duration=30):
+        """
+        Stream logs from a specific EC2 instance for a specified duration.
+        Sleeps are awaited, so other instance streams proceed concurrently.
+
+        Args:
+            instance_id (str): The ID of the EC2 instance to stream logs from.
+            interval (int): The interval in seconds between each log stream (default is 5 seconds).
+            duration (int): The total duration in seconds to stream logs for (default is 30 seconds).
+
+        Returns:
+            None
+        """
+
+        end_time = time.time() + duration
+
+        while time.time() < end_time:
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            console_output = await self.get_ec2_instance_console_output(instance_id)
+
+            self.logging_function(
+                f"{current_time} - {instance_id} Console Output: {console_output}"
+            )
+
+            await asyncio.sleep(interval)
+
+    async def stream_logs_from_ec2_instances(self, instance_ids: List[str], interval=5, duration=30):
+        """
+        Stream logs from multiple EC2 instances concurrently - one task per instance,
+        gathered so total streaming time stays at roughly `duration`.
+
+        Args:
+            instance_ids (List[str]): The IDs of the EC2 instances to stream logs from.
+            interval (int): The interval in seconds between each log stream (default is 5 seconds).
+            duration (int): The total duration in seconds to stream logs for (default is 30 seconds).
+
+        Returns:
+            None
+        """
+
+        await asyncio.gather(
+            *(
+                self.stream_logs_from_ec2_instance(instance_id, interval, duration)
+                for instance_id in instance_ids
+            )
+        )
+
+    async def deploy(self, ec2_config: EC2InstanceConfig):
+        """
+        Deploy EC2 instances directly and stream their logs concurrently.
+
+        Autoscaling deployment stays on the sync EC2CLI for now - the launch
+        template / ASG creation steps are sequentially dependent, so async
+        buys nothing there.
+
+        Args:
+            ec2_config (EC2InstanceConfig): Configuration for the EC2 instances.
+
+        Returns:
+            None
+        """
+
+        self.logging_function("Deploying EC2 instances directly...")
+        response = await self.ec2_client.run_instances(**ec2_config.to_dict())
+        instance_ids = [instance["InstanceId"] for instance in response["Instances"]]
+        self.logging_function(
+            f"Deployed {len(instance_ids)} instances. Instance IDs: {', '.join(instance_ids)}"
+        )
+
+        self.deployed_instance_ids += instance_ids
+        self.logging_function("Deployment completed successfully")
+
+        await self.stream_logs_from_ec2_instances(instance_ids)
@@ -0,0 +1,119 @@
+from concurrent.futures import Future
+from threading import Condition, Thread
+from typing import Callable, Dict, List
+
+import logging
+
+logger = logging.getLogger("aws_agent_logger")
+
+
+class InstanceIDBatcher:
+    """
+    Coalesces per-instance EC2 API requests into batched describe calls.
+
+    Callers submit individual instance IDs and receive a Future; a background
+    flusher thread buffers the pending IDs and issues a single batched call
+    (e.g. describe_instances(InstanceIds=[...])) once the flush interval elapses
+    or the buffer fills, then demultiplexes the response into each Future.
+
+    Under repeated polling of many instances this reduces the number of EC2 API
+    calls by up to a factor of the batch size, lowering throttling risk.
+
+    Args:
+        batch_fn (Callable[[List[str]], Dict[str, any]]): Function taking a list of
+            instance IDs and returning a dict mapping each instance ID to its result.
+        max_batch_size (int): Flush immediately once this many IDs are pending. Defaults to 50.
+        flush_interval (float): Seconds to buffer IDs before flushing. Defaults to 0.3.
+    """
+
+    def __init__(
+            self,
+            batch_fn: Callable[[List[str]], Dict],
+            max_batch_size: int = 50,
+            flush_interval: float = 0.3,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+
+        self._pending: Dict[str, Future] = {}
+        self._condition = Condition()
+        self._stopped = False
+
+        self._flusher = Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    def submit(self, instance_id: str) -> Future:
+        """
+        Queue an instance ID for the next batched call.
+
+        Args:
+            instance_id (str): The ID of the EC2 instance.
+
+        Returns:
+            Future: Resolves to the per-instance result once the batch call completes.
+        """
+
+        with self._condition:
+            # coalesce duplicate IDs submitted within the same flush window
+            if instance_id in self._pending:
+                return self._pending[instance_id]
+
+            future = Future()
+            self._pending[instance_id] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self._condition.notify()
+
+            return future
+
+    def _flush_loop(self):
+        """
+        Background loop - wakes every flush_interval (or immediately when the
+        buffer fills) and flushes whatever is pending.
+        """
+
+        while True:
+            with self._condition:
+                self._condition.wait(timeout=self.flush_interval)
+                if self._stopped:
+                    return
+                if not self._pending:
+                    continue
+                batch, self._pending = self._pending, {}
+
+            self._flush(batch)
+
+    def _flush(self, batch: Dict[str, Future]):
+        """
+        Issue one batched call for the buffered IDs and demultiplex the results.
+
+        Args:
+            batch (Dict[str, Future]): Pending instance IDs mapped to their Futures.
+        """
+
+        try:
+            results = self.batch_fn(list(batch))
+        except Exception as e:
+            logger.error(f"Batched describe call failed: {e}")
+            for future in batch.values():
+                future.set_exception(e)
+            return
+
+        for instance_id, future in batch.items():
+            future.set_result(results.get(instance_id))
+
+    def stop(self):
+        """
+        Stop the background flusher thread, flushing anything still pending first.
+        """
+
+        with self._condition:
+            batch, self._pending = self._pending, {}
+            self._stopped = True
+            self._condition.notify()
+
+        if batch:
+            self._flush(batch)
+
+        self._flusher.join(timeout=self.flush_interval + 1)
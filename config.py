@@ -6,6 +6,23 @@ REFLECTION_PROMPT_VERSION = 1.0
 DEFAULT_RAM = 8.0
 DEFAULT_CPU = 2
 
+# max conversation lines kept in memory / sent to the LLM - intents are
+# naturally single-turn, so a bounded window loses little and caps prompt size
+HISTORY_MAX_TURNS = 40
+
+# effective backend log level - payload-sized entries (full histories/prompts)
+# log at DEBUG, so INFO in production skips building those strings entirely
+LOG_LEVEL = "INFO"
+
+# 50MB per log file - small rotation thresholds make the listener thread pay
+# the rename/reopen cost (and an fsync on some filesystems) every few thousand
+# payload-sized records
+LOG_MAX_BYTES = 50 * 1024 * 1024
+
+# records buffered in memory before a batched write to the file handler;
+# ERROR or worse flushes immediately
+LOG_BUFFER_CAPACITY = 1000
+
 RAVEN_API_URL = "http://nexusraven.nexusflow.ai"
 
 RAVEN_LLM_PARAMETERS = {
@@ -14,4 +31,8 @@ RAVEN_LLM_PARAMETERS = {
     "do_sample": False,
     "max_new_tokens": 2048,
     "return_full_text": False,
+    # stable salt keying the server's automatic prefix cache (vLLM/TGI style) -
+    # the function_list prefix is byte-identical across turns, so a warm cache
+    # skips its prefill entirely. Bump the version when the prompt changes.
+    "cache_salt": "aws_agent_fc_v1",
 }
@@ -1,23 +1,29 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import ast
+import re
+import sys
+import textwrap
 from typing import Dict, List, Union, Optional
 import config
 import logging
 
-logger = logging.getLogger("aws_agent_logger")
-
+# optional: C-accelerated JSON for the multi-KB prompt payloads - falls back
+# to requests' stdlib json handling when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class LLMInterface:
-    """
-    Interface for all LLM calls and output parsing
-    """
+logger = logging.getLogger("aws_agent_logger")
 
-    def __init__(self):
-        # We're essentially using this prompt below as a router / intent classifier
-        # Scaling function calls from here --> Can add multiple routers chained
-        # ex first router routes to for ex cli decision engine --> engine routes to correct cli call
 
-        self.function_list = '''
+# The multi-KB function list and prompt templates are constants - building
+# them once at import (and dedenting once) beats re-materializing the
+# literals per LLMInterface instance, and keeps the bytes stable for the
+# server-side prefix cache
+_FUNCTION_LIST = textwrap.dedent('''
             Function:
             def user_intent_ec2_type_selection(cpu: Optional[int] = None, ram: Optional[float] = None):
                 """
@@ -112,9 +118,9 @@ class LLMInterface:
                 The function takes no arguments.
                 Example: 'Hello' or 'what's the capital of France'
                 """
-        '''
+''')
 
-        self.function_calling_prompt = """
+_FUNCTION_CALLING_PROMPT = textwrap.dedent("""
             <human>
             
             {function_list}
@@ -124,20 +130,253 @@ class LLMInterface:
             
             Current User Query: {query}
             <human_end>
-            """
+    """)
 
-        self.reflective_prompt = """
+_REFLECTIVE_PROMPT = textwrap.dedent("""
             <human>
-            
+
             {function_list}
-            
+
             Conversation History:
             {history}
-            
+
             Current User Query: {query}
-            
+
             <human_end>
-            """
+    """)
+
+
+# Raven outputs follow the narrow grammar name(kw=literal, kw=literal, ...) -
+# a compiled regex walk over the <200-byte response replaces the full CPython
+# parser (ast.parse builds a lexer/parser/AST per call) on the happy path
+_CALL_RE = re.compile(r"\s*([A-Za-z_][A-Za-z0-9_]*)\((.*)\)\s*$", re.S)
+_KW_RE = re.compile(
+    r"\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"
+    r"(\"[^\"]*\"|'[^']*'|-?\d+\.\d+|-?\d+|True|False|None|\[[^\]]*\])\s*,?",
+    re.S,
+)
+
+_LITERAL_CONSTANTS = {"True": True, "False": False, "None": None}
+
+# the closed set of dispatchable intents, interned so parsed names that pass
+# validation share one canonical string object - downstream dict lookups
+# (dispatch table, skip-sets) then compare by pointer instead of char-by-char
+_INTENT_NAMES = frozenset(
+    map(
+        sys.intern,
+        (
+            "user_intent_ec2_type_selection",
+            "user_intent_confirm",
+            "user_intent_enable_autoscaling",
+            "user_intent_display_current_deployment_config",
+            "user_intent_modify_ec2_config",
+            "user_intent_modify_as_config",
+            "user_intent_out_of_scope",
+        ),
+    )
+)
+
+# zero-arg intents where reflection has nothing to second-guess - there are no
+# predicted arguments to verify, so the reflection pass is pure cost for these
+_ZERO_ARG_SKIP_REFLECT = frozenset(
+    {
+        "user_intent_confirm",
+        "user_intent_enable_autoscaling",
+        "user_intent_display_current_deployment_config",
+        "user_intent_out_of_scope",
+    }
+)
+
+
+def _parse_literal(raw: str):
+    """
+    Convert one matched literal token to its Python value.
+
+    Args:
+        raw (str): Token matched by _KW_RE - quoted string, int, float,
+            True/False/None, or a list literal.
+
+    Returns:
+        The parsed Python value.
+    """
+
+    if raw[0] in "\"'":
+        return raw[1:-1]
+    if raw in _LITERAL_CONSTANTS:
+        return _LITERAL_CONSTANTS[raw]
+    if raw[0] == "[":
+        # list literals are rare (AvailabilityZones) - lean on literal_eval for those only
+        return ast.literal_eval(raw)
+    return float(raw) if "." in raw else int(raw)
+
+
+def _parse_function_call_fast(llm_response: str) -> Optional[Dict]:
+    """
+    Fast-path parse of a Raven function call via regex.
+
+    Args:
+        llm_response (str): The raw response string, e.g. 'find_best_instance(cpu=4, ram=8.0)'.
+
+    Returns:
+        Optional[Dict]: {"function_name", "kwargs"} on success, or None when the
+            response doesn't fit the simple grammar (caller falls back to ast.parse).
+    """
+
+    call_match = _CALL_RE.match(llm_response)
+    if call_match is None:
+        return None
+
+    function_name, args_str = call_match.group(1), call_match.group(2).strip()
+
+    kwargs = {}
+    pos = 0
+    while pos < len(args_str):
+        kw_match = _KW_RE.match(args_str, pos)
+        if kw_match is None:
+            # unexpected argument shape - let the ast fallback decide
+            return None
+        try:
+            kwargs[kw_match.group(1)] = _parse_literal(kw_match.group(2))
+        except (ValueError, SyntaxError):
+            return None
+        pos = kw_match.end()
+
+    return {"function_name": function_name, "kwargs": kwargs}
+
+
+class LLMInterface:
+    """
+    Interface for all LLM calls and output parsing
+    """
+
+    def __init__(self):
+        # We're essentially using this prompt below as a router / intent classifier
+        # Scaling function calls from here --> Can add multiple routers chained
+        # ex first router routes to for ex cli decision engine --> engine routes to correct cli call
+
+        self.function_list = _FUNCTION_LIST
+        self.function_calling_prompt = _FUNCTION_CALLING_PROMPT
+        self.reflective_prompt = _REFLECTIVE_PROMPT
+
+        # Pre-split each template around its {history}/{query} slots with the
+        # large static function_list already embedded - per-turn prompt building
+        # becomes one concatenation instead of re-scanning the multi-KB template
+        # with str.format on every call.
+        # The prefix segment must stay byte-identical across turns (no per-turn
+        # data before the history block): inference servers reuse cached KV
+        # tensors for a stable prompt prefix, skipping prefill of the multi-KB
+        # function_list - see cache_salt in config.RAVEN_LLM_PARAMETERS
+        self._fc_parts = self._split_prompt_template(self.function_calling_prompt)
+        self._reflective_parts = self._split_prompt_template(self.reflective_prompt)
+
+        # deterministic shortcut table - queries like 'yes' or 'show config'
+        # map to a zero-arg intent without paying an LLM round-trip; anything
+        # unmatched (type selection, config modifications) still goes to the model
+        self._fast_patterns = [
+            (
+                re.compile(r"^\s*(yes|y|looks?\s*good|confirm|ok(ay)?)\s*\.?\s*$", re.I),
+                "user_intent_confirm",
+            ),
+            (
+                re.compile(r"^\s*(enable\s+)?auto[-\s]?scaling\s*\.?\s*$", re.I),
+                "user_intent_enable_autoscaling",
+            ),
+            (
+                re.compile(
+                    r"^\s*(show|display)\s+(current\s+)?(deployment\s+)?config(uration)?\s*$",
+                    re.I,
+                ),
+                "user_intent_display_current_deployment_config",
+            ),
+        ]
+
+        # pooled session keeps the TCP/TLS connection to the endpoint alive
+        # across turns - a fresh requests.post per call pays a full handshake
+        # (plus TCP slow-start) on every LLM hop
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # the parameters block is identical on every request - serialize it
+        # once and splice the bytes into each body instead of re-encoding the
+        # whole payload dict per call (prompt strings dominate, but the
+        # parameters dict re-walk is pure waste)
+        self._params_json = (
+            orjson.dumps(config.RAVEN_LLM_PARAMETERS) if orjson is not None else None
+        )
+
+    def prewarm_connection(self):
+        """
+        Open (or refresh) the pooled connection to the Raven endpoint with a
+        cheap HEAD request.
+
+        Meant to run in the background while the agent waits on user input, so
+        the TCP/TLS handshake overlaps think-time instead of delaying the first
+        real LLM call of the turn. Failures are swallowed - this is purely an
+        optimization and the actual request path has its own error handling.
+
+        Returns:
+            None
+        """
+
+        try:
+            self._session.head(config.RAVEN_API_URL, timeout=(3, 5))
+        except requests.RequestException:
+            logger.debug("Connection prewarm failed - will connect on first LLM call")
+
+    def _fast_classify(self, query: str) -> Optional[Dict]:
+        """
+        Match a query against the precompiled trivial-intent patterns.
+
+        Args:
+            query (str): The raw user query.
+
+        Returns:
+            Optional[Dict]: {"function_name", "kwargs": {}} when the query is an
+                unambiguous zero-arg intent, otherwise None (caller hits the LLM).
+        """
+
+        for pattern, function_name in self._fast_patterns:
+            if pattern.match(query):
+                return {"function_name": function_name, "kwargs": {}}
+        return None
+
+    def _split_prompt_template(self, template: str) -> tuple:
+        """
+        Split a prompt template into (prefix, mid, suffix) segments around the
+        {history} and {query} placeholders, with {function_list} substituted once.
+
+        Args:
+            template (str): Prompt template containing {function_list}, {history} and {query}.
+
+        Returns:
+            tuple: (prefix, mid, suffix) string segments.
+        """
+
+        prefix, rest = template.split("{history}")
+        mid, suffix = rest.split("{query}")
+        return prefix.replace("{function_list}", self.function_list), mid, suffix
+
+    def _build_prompt(self, parts: tuple, history: str, query: str) -> str:
+        """
+        Assemble a prompt from precomputed template segments.
+
+        Args:
+            parts (tuple): (prefix, mid, suffix) from _split_prompt_template.
+            history (str): Formatted conversation history.
+            query (str): The current user query.
+
+        Returns:
+            str: The full prompt.
+        """
+
+        prefix, mid, suffix = parts
+        return f"{prefix}{history}{mid}{query}{suffix}"
 
     @staticmethod
     def convert_raven_function_calling_response_to_function_name_and_args(
@@ -166,6 +405,28 @@ class LLMInterface:
             "kwargs": {},
         }
 
+        # well-formed responses take the regex fast path; anything it can't
+        # handle (nested calls, multiple statements, odd literals) falls back
+        # to the full ast.parse route below
+        fast_parsed = _parse_function_call_fast(llm_response)
+        if fast_parsed is not None:
+            # canonicalize and validate in one step - an interned unknown name
+            # means the model hallucinated a function, which is out of scope
+            name = sys.intern(fast_parsed["function_name"])
+            if name not in _INTENT_NAMES:
+                logger.info("LLM predicted unknown function %s", name)
+                return out_of_scope_response
+            fast_parsed["function_name"] = name
+            return fast_parsed
+
+        # cheap shape check before paying for a full parse - any single
+        # function call ends with ')' and contains '(', so free-text responses
+        # ('I cannot help with that...') are rejected without building an AST
+        stripped = llm_response.strip()
+        if "(" not in stripped or not stripped.endswith(")"):
+            logger.info("LLM function call prediction not shaped like a call")
+            return out_of_scope_response
+
         try:
             # parse the string into an AST
             parsed = ast.parse(llm_response)
@@ -192,38 +453,92 @@ class LLMInterface:
             # can be ints, floats, strings
             kwargs = {}
             for keyword in call.keywords:
-                if isinstance(keyword.value, (ast.Str, ast.Num, ast.NameConstant)):
-                    kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+                # constants carry their parsed value directly - no literal_eval
+                # re-walk needed, and ast.Constant replaces the Str/Num/NameConstant
+                # aliases deprecated since 3.8
+                if isinstance(keyword.value, ast.Constant):
+                    kwargs[keyword.arg] = keyword.value.value
                 else:
                     kwargs[keyword.arg] = str(ast.dump(keyword.value))
 
+            function_name = sys.intern(function_name)
+            if function_name not in _INTENT_NAMES:
+                logger.info("LLM predicted unknown function %s", function_name)
+                return out_of_scope_response
+
             function_call_dict = {"function_name": function_name, "kwargs": kwargs}
 
             return function_call_dict
 
         except Exception as e:
             logger.error(
-                "Error came up in parsing function calling response: " + str(e)
+                "Error came up in parsing function calling response: %s", e
             )
             return out_of_scope_response
 
-    @staticmethod
+    def _compose_body(self, inputs: Union[str, List[str]]):
+        """
+        Build the request payload for the Raven endpoint.
+
+        With orjson available this returns ready-to-send bytes with the
+        pre-serialized parameters block spliced in - only the per-call inputs
+        are encoded. Otherwise returns the payload dict for stdlib encoding.
+
+        Args:
+            inputs (Union[str, List[str]]): A single prompt or a batch of prompts.
+
+        Returns:
+            Union[bytes, Dict]: The request body.
+        """
+
+        if self._params_json is not None:
+            return (
+                b'{"inputs":'
+                + orjson.dumps(inputs)
+                + b',"parameters":'
+                + self._params_json
+                + b"}"
+            )
+
+        return {"inputs": inputs, "parameters": config.RAVEN_LLM_PARAMETERS}
+
     def request_to_raven_endpoint(
-            payload: Dict[str, Union[str, List, bool, float, int]]
+            self, payload: Union[bytes, Dict[str, Union[str, List, bool, float, int]]]
     ) -> Dict:
         """
         Makes a request to the Raven LLM endpoint.
 
         Args:
-            payload (Dict[str, Union[str, List, bool, float, int]]): The payload to send to the endpoint containing LLM parameters
+            payload (Union[bytes, Dict]): The request body - either precomposed JSON
+                bytes from _compose_body, or a payload dict. "inputs" may be a single
+                prompt string or a list of prompts - the server batches a list into
+                one forward pass.
 
         Returns:
             Dict: response from the endpoint containing LLM response
         """
 
-        headers = {"Content-Type": "application/json"}
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+        if isinstance(payload, bytes):
+            # precomposed bodies only exist when orjson is importable
+            response = self._session.post(
+                config.RAVEN_API_URL, headers=headers, data=payload, timeout=(3, 60)
+            )
+            return orjson.loads(response.content)
+
+        if orjson is not None:
+            response = self._session.post(
+                config.RAVEN_API_URL,
+                headers=headers,
+                data=orjson.dumps(payload),
+                timeout=(3, 60),
+            )
+            return orjson.loads(response.content)
 
-        response = requests.post(config.RAVEN_API_URL, headers=headers, json=payload)
+        response = self._session.post(
+            config.RAVEN_API_URL, headers=headers, json=payload, timeout=(3, 60)
+        )
         return response.json()
 
     def raven_llm_query(self, prompt: str) -> str:
@@ -237,16 +552,127 @@ class LLMInterface:
             str: The generated output text after processing the response.
         """
 
-        resp = self.request_to_raven_endpoint(
-            {"inputs": prompt, "parameters": config.RAVEN_LLM_PARAMETERS}
-        )
+        resp = self.request_to_raven_endpoint(self._compose_body(prompt))
 
         output = resp[0]["generated_text"].replace("Call:", "").strip()
 
         return output
 
+    def raven_llm_query_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Sends multiple prompts to the Raven endpoint in a single request so the
+        server can batch them into one forward pass - one network round-trip
+        instead of one per prompt.
+
+        Args:
+            prompts (List[str]): The prompts to be sent to the Raven endpoint.
+
+        Returns:
+            List[str]: Generated output text per prompt, in input order.
+
+        Raises:
+            ValueError: If the endpoint doesn't return one generation per prompt
+                (callers can fall back to sequential single-prompt requests).
+        """
+
+        resp = self.request_to_raven_endpoint(self._compose_body(prompts))
+
+        if not isinstance(resp, list) or len(resp) != len(prompts):
+            raise ValueError(
+                f"Expected {len(prompts)} generations from batched request, got: {resp}"
+            )
+
+        return [r["generated_text"].replace("Call:", "").strip() for r in resp]
+
+    def generate_and_reflect(
+            self,
+            query: str,
+            conversation_history: str,
+            history_without_last: Optional[str] = None,
+    ) -> tuple:
+        """
+        Gets the function-calling response and its reflection in one batched
+        endpoint request, halving the per-turn round-trips when reflection is on.
+
+        The reflective prompt is built against the pre-reflection history (the
+        generated response is not yet part of it) - the tradeoff for batching
+        both prompts before the generation output exists.
+
+        Falls back to sequential get_llm_function_calling_response + reflect
+        calls if the endpoint doesn't support batched inputs.
+
+        Args:
+            query (str): The query used to make the function call.
+            conversation_history (str): The full history preformatted as a single string.
+            history_without_last (Optional[str]): Preformatted history minus the trailing
+                query line. Defaults to the full history.
+
+        Returns:
+            tuple: (generation Dict, reflection Dict) of parsed function calls.
+        """
+
+        # trivial queries resolve deterministically - no generation to reflect on
+        fast_call = self._fast_classify(query)
+        if fast_call is not None:
+            logger.info("Fast-path intent match: %s", fast_call["function_name"])
+            return fast_call, fast_call
+
+        # same history variants the sequential methods use - generation drops
+        # the trailing query line, reflection keeps the full history
+        history_full = conversation_history
+        if history_without_last is None:
+            history_without_last = conversation_history
+
+        fc_prompt = self._build_prompt(self._fc_parts, history_without_last, query)
+        reflective_prompt = self._build_prompt(self._reflective_parts, history_full, query)
+
+        try:
+            fc_response_str, reflection_response_str = self.raven_llm_query_batch(
+                [fc_prompt, reflective_prompt]
+            )
+        except ValueError:
+            logger.info("Batched generation unsupported by endpoint - falling back to sequential calls")
+            generation = self.get_llm_function_calling_response(
+                query, history_without_last
+            )
+            # zero-arg intents carry no arguments to verify - skip the
+            # reflection round-trip entirely in the sequential path
+            if generation["function_name"] in _ZERO_ARG_SKIP_REFLECT:
+                logger.info(
+                    "Skipping reflection for zero-arg intent %s",
+                    generation["function_name"],
+                )
+                return generation, generation
+            return generation, self.reflect(query, history_full)
+
+        logger.info("Function call response string: %s", fc_response_str)
+        logger.info("Reflection call response string: %s", reflection_response_str)
+
+        generation = (
+            self.convert_raven_function_calling_response_to_function_name_and_args(
+                fc_response_str
+            )
+        )
+
+        # both prompts already shared one batched request here, but a zero-arg
+        # generation still makes its reflection meaningless - return the
+        # generation for both rather than letting reflection flip a trivial intent
+        if generation["function_name"] in _ZERO_ARG_SKIP_REFLECT:
+            logger.info(
+                "Discarding reflection for zero-arg intent %s",
+                generation["function_name"],
+            )
+            return generation, generation
+
+        return (
+            generation,
+            self.convert_raven_function_calling_response_to_function_name_and_args(
+                reflection_response_str
+            ),
+        )
+
     def get_llm_function_calling_response(
-            self, query: str, conversation_history: Optional[List[str]] = None
+            self, query: str, conversation_history: str = ""
     ) -> Dict:
         """
         Gets the response of an LLM function call based on a query.
@@ -255,29 +681,32 @@ class LLMInterface:
 
         Args:
             query (str): The query used to make the function call.
-            conversation_history (List[str], optional): The history of conversation strings. Defaults to an empty list.
+            conversation_history (str, optional): Preformatted history string already
+                excluding the trailing query line (the agent maintains this incrementally).
 
         Returns:
             Dict: The response of the function call.
         """
 
-        # Take up to -1 to remove last query and put at end as 'Current User Query'
-        formatted_conversation_history = "\n".join(conversation_history[:-1])
+        # deterministic shortcut for trivial queries - skips the network entirely
+        fast_call = self._fast_classify(query)
+        if fast_call is not None:
+            logger.info("Fast-path intent match: %s", fast_call["function_name"])
+            return fast_call
 
-        logger.info(f"Query sent for function call generation: {query}")
-        logger.info(
-            f"Conversation History sent for function call generation: {formatted_conversation_history}"
+        formatted_conversation_history = conversation_history
+
+        logger.info("Query sent for function call generation: %s", query)
+        logger.debug(
+            "Conversation History sent for function call generation: %s",
+            formatted_conversation_history,
         )
 
         function_call_response_str = self.raven_llm_query(
-            self.function_calling_prompt.format(
-                function_list=self.function_list,
-                history=formatted_conversation_history,
-                query=query,
-            )
+            self._build_prompt(self._fc_parts, formatted_conversation_history, query)
         )
 
-        logger.info(f"Function call response string: {function_call_response_str}")
+        logger.info("Function call response string: %s", function_call_response_str)
 
         function_call_response_dict = (
             self.convert_raven_function_calling_response_to_function_name_and_args(
@@ -286,12 +715,12 @@ class LLMInterface:
         )
 
         logger.info(
-            f"Parsed function call and arguments: {function_call_response_dict}"
+            "Parsed function call and arguments: %s", function_call_response_dict
         )
 
         return function_call_response_dict
 
-    def reflect(self, query, conversation_history: Optional[List[str]] = None) -> Dict:
+    def reflect(self, query, conversation_history: str = "") -> Dict:
         """
         Function reflectively analyzes previous user responses and the agent's current response
         to judge whether right function was called.
@@ -301,30 +730,30 @@ class LLMInterface:
 
         Args:
             query (str): The query to be reflected.
-            conversation_history (List[str], optional): The history of conversation strings. Defaults to an empty list.
+            conversation_history (str, optional): The full history preformatted as a
+                single string, including the first agent generation.
 
         Returns:
             Dict: The response of the agent after reflection
         """
 
-        # for reflection example here - consider whole conversation history including first agent generation
-        formatted_conversation_history = "\n".join(conversation_history)
+        formatted_conversation_history = conversation_history
 
-        logger.info(f"Query sent for function call generation: {query}")
-        logger.info(
-            f"Conversation History sent for function call generation: {formatted_conversation_history}"
+        logger.info("Query sent for function call generation: %s", query)
+        logger.debug(
+            "Conversation History sent for function call generation: %s",
+            formatted_conversation_history,
         )
 
         reflection_function_call_response_str = self.raven_llm_query(
-            self.reflective_prompt.format(
-                function_list=self.function_list,
-                history=formatted_conversation_history,
-                query=query,
+            self._build_prompt(
+                self._reflective_parts, formatted_conversation_history, query
             )
         )
 
         logger.info(
-            f"Reflection call response string: {reflection_function_call_response_str}"
+            "Reflection call response string: %s",
+            reflection_function_call_response_str,
         )
 
         reflection_function_call_response_dict = (
@@ -334,7 +763,8 @@ class LLMInterface:
         )
 
         logger.info(
-            f"Parsed reflection function call and arguments: {reflection_function_call_response_dict}"
+            "Parsed reflection function call and arguments: %s",
+            reflection_function_call_response_dict,
         )
 
         return reflection_function_call_response_dict
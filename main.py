@@ -10,6 +10,8 @@ from utils.general_utils import setup_logger
 import config
 from moto import mock_aws
 from typing import Dict
+import asyncio
+from collections import deque
 
 logger = setup_logger()
 
@@ -39,8 +41,49 @@ class AWSAgent:
         self.as_config.VPCZoneIdentifier = ec2_cli.subnet_id
         self.autoscaling_enabled = False
 
-        # memory - simple implementation
-        self.conversation_history = []
+        # memory - simple implementation, bounded so long sessions don't grow
+        # the prompt (and the per-turn join cost) without limit
+        self.conversation_history = deque(maxlen=config.HISTORY_MAX_TURNS)
+
+        # incrementally maintained joined views of the history - appending a
+        # line costs O(len(line)) instead of re-joining the whole history per turn
+        self._history_all = ""
+        self._history_without_last = ""
+
+        # intent routing table - O(1) lookup per turn, and adding an intent is
+        # one entry here instead of another if/elif branch
+        self._intent_dispatch = {
+            "user_intent_ec2_type_selection": self.handle_user_intent_ec2_type_selection,
+            "user_intent_confirm": self.handle_user_intent_confirm,
+            "user_intent_enable_autoscaling": self.handle_user_intent_enable_autoscaling,
+            # Function is used both as an intent and as a utility for other intents
+            "user_intent_display_current_deployment_config": self.display_current_deployment_config,
+            "user_intent_modify_ec2_config": self.handle_user_intent_modify_ec2_config,
+            "user_intent_modify_as_config": self.handle_user_intent_modify_as_config,
+        }
+
+    def _push_history(self, line: str):
+        """
+        Append a line to the conversation history, keeping the pre-joined
+        string views in sync.
+
+        Args:
+            line (str): The formatted conversation line to append.
+        """
+
+        evicting = len(self.conversation_history) == self.conversation_history.maxlen
+        self.conversation_history.append(line)
+
+        if evicting:
+            # oldest line fell off the window - rebuild both views
+            lines = tuple(self.conversation_history)
+            self._history_without_last = "\n".join(lines[:-1])
+            self._history_all = "\n".join(lines)
+        else:
+            self._history_without_last = self._history_all
+            self._history_all = (
+                f"{self._history_all}\n{line}" if self._history_all else line
+            )
 
     def handle_user_intent(self, predicted_function_call: Dict):
         """
@@ -49,9 +92,7 @@ class AWSAgent:
         Most function-calling architectures provide granularity by default - providing the function call and parameters
         separately.
 
-        Here, we're directing to the appropriate function based on the function call for easier visualization of routing.
-        If the number of intents were to scale significantly, this could easily be adjusted to directly call the function
-        instead of having all if/else statements here. Would still need if/else for out of scope intent.
+        Here, we're directing to the appropriate function via the dispatch table built in __init__.
 
         Args:
             predicted_function_call (Dict): A dictionary containing the function name and its keyword arguments.
@@ -62,28 +103,16 @@ class AWSAgent:
 
         logger.info(f"{function_name} called with arguments {kwargs}")
 
-        if function_name == "user_intent_ec2_type_selection":
-            self.handle_user_intent_ec2_type_selection(**kwargs)
-
-        elif function_name == "user_intent_confirm":
-            self.handle_user_intent_confirm()
+        handler = self._intent_dispatch.get(function_name, self._handle_out_of_scope)
+        handler(**kwargs)
 
-        elif function_name == "user_intent_enable_autoscaling":
-            self.handle_user_intent_enable_autoscaling()
-
-        elif function_name == "user_intent_display_current_deployment_config":
-            # Function is used both as an intent and as a utility for other intents
-            self.display_current_deployment_config()
-
-        elif function_name == "user_intent_modify_ec2_config":
-            self.handle_user_intent_modify_ec2_config(**kwargs)
-
-        elif function_name == "user_intent_modify_as_config":
-            self.handle_user_intent_modify_as_config(**kwargs)
+    def _handle_out_of_scope(self, **kwargs):
+        """
+        Fallback handler - either out_of_scope function predicted directly,
+        or generated text not one of the dispatchable intents.
+        """
 
-        else:
-            # out of scope - either out_of_scope function predicted directly, or generated text not one of above functions
-            self.ui.log_to_user("Sorry, I didn't understand that. Please try again.")
+        self.ui.log_to_user("Sorry, I didn't understand that. Please try again.")
 
     def handle_user_intent_enable_autoscaling(self):
         """
@@ -152,60 +181,94 @@ class AWSAgent:
         Used to handle the user intent to display current config in addition to being used as utility function for other intents
         """
 
-        self.ui.display_recommended_config(self.ec2_config.to_dict(), config_type="EC2")
+        # display_string caches its rendering until the config is next modified
+        self.ui.display_recommended_config(
+            self.ec2_config.display_string(), config_type="EC2"
+        )
 
         if self.autoscaling_enabled:
             self.ui.display_recommended_config(
-                self.as_config.to_dict(), config_type="AutoScaling"
+                self.as_config.display_string(), config_type="AutoScaling"
             )
 
         self.ui.log_to_user("\nHow does this look?")
 
-    def run(self):
-        try:
-            # intro sequence start - prompt user for ec2 type cpu and ram requirements
-            ec2_requirements = self.ui.prompt_user_for_ec2_requirements()
-            self.conversation_history.append(f"<human> {ec2_requirements} <human_end>")
+    async def _get_agent_response(self, query: str) -> Dict:
+        """
+        Runs the LLM round for a query off the event loop thread.
+        With reflection enabled, generation + reflection share one batched
+        request instead of two sequential round-trips.
 
-            # hit LLM to get function call with predicted parameters
-            predicted_function_call = (
-                self.llm_interface.get_llm_function_calling_response(
-                    ec2_requirements, self.conversation_history
-                )
+        Args:
+            query (str): The current user query.
+
+        Returns:
+            Dict: The parsed function call to act on.
+        """
+
+        if self.run_reflection:
+            _, reflected_function_call = await asyncio.to_thread(
+                self.llm_interface.generate_and_reflect,
+                query,
+                self._history_all,
+                self._history_without_last,
+            )
+            return reflected_function_call
+
+        return await asyncio.to_thread(
+            self.llm_interface.get_llm_function_calling_response,
+            query,
+            self._history_without_last,
+        )
+
+    async def run_async(self):
+        """
+        Async agent loop. Blocking pieces (stdin input, HTTP calls to the LLM)
+        run on worker threads, leaving the event loop free to overlap background
+        work (connection warmup, log flushes) with user think-time.
+        """
+
+        try:
+            # warm the endpoint connection while the user types - the TLS
+            # handshake overlaps think-time instead of fronting the first call
+            self._warmup_task = asyncio.create_task(
+                asyncio.to_thread(self.llm_interface.prewarm_connection)
             )
 
-            self.conversation_history.append(
-                f"<bot> {predicted_function_call} <bot_end>"
+            # intro sequence start - prompt user for ec2 type cpu and ram requirements
+            ec2_requirements = await asyncio.to_thread(
+                self.ui.prompt_user_for_ec2_requirements
             )
+            self._push_history(f"<human> {ec2_requirements} <human_end>")
 
-            # run reflection on current generation to adjust function call if needed
-            if self.run_reflection:
-                predicted_function_call = self.llm_interface.reflect(
-                    ec2_requirements, self.conversation_history
-                )
+            # hit LLM to get function call with predicted parameters
+            predicted_function_call = await self._get_agent_response(ec2_requirements)
+
+            self._push_history(f"<bot> {predicted_function_call} <bot_end>")
 
             self.handle_user_intent(predicted_function_call)
 
             # now go into dialogue flow
             while True:
-                user_response = self.ui.get_user_response()
-                self.conversation_history.append(f"<human> {user_response} <human_end>")
-                agent_response = self.llm_interface.get_llm_function_calling_response(
-                    user_response, self.conversation_history
+                # refresh the keep-alive connection each turn in case it idled out
+                self._warmup_task = asyncio.create_task(
+                    asyncio.to_thread(self.llm_interface.prewarm_connection)
                 )
+                user_response = await asyncio.to_thread(self.ui.get_user_response)
+                self._push_history(f"<human> {user_response} <human_end>")
 
-                if self.run_reflection:
-                    agent_response = self.llm_interface.reflect(
-                        user_response, self.conversation_history
-                    )
+                agent_response = await self._get_agent_response(user_response)
 
-                self.conversation_history.append(f"<bot> {agent_response} <bot_end>")
+                self._push_history(f"<bot> {agent_response} <bot_end>")
 
                 self.handle_user_intent(agent_response)
 
         except Exception as e:
             self.ui.log_to_user(f"Error: {str(e)}")
 
+    def run(self):
+        asyncio.run(self.run_async())
+
 
 def main():
     # setup mock local sql db from local csv
@@ -214,6 +277,9 @@ def main():
     )
 
     config.sql_ec2_connection_pool = SQLiteConnectionPool("ec2.db")
+    # open the main thread's connection and page in the table now, instead of
+    # paying connect+PRAGMA latency on the first recommendation request
+    config.sql_ec2_connection_pool.warmup()
 
     # Use mock_aws module to simulate AWS cli calls and provide mocked console logging
     # Note: mock_aws does not handle parameter validation real cli deployment would report*
@@ -20,18 +20,20 @@ class UserInterface:
         """
 
         prompt_to_user = "Enter EC2 requirements - Amount of RAM and CPU cores: "
-        logger.info(f"Agent prompting user - {prompt_to_user}")
+        logger.info("Agent prompting user - %s", prompt_to_user)
 
         return input(prompt_to_user)
 
     def display_recommended_config(
-            self, config: Dict[str, Union[str, int]], config_type: str = "EC2"
+            self, config: Union[Dict[str, Union[str, int]], str], config_type: str = "EC2"
     ):
         """
         Displaying recommended config to user. This function could be extended to generalized bot response
 
         Args:
-            config (Dict[str, Union[str, int]]): The recommended ec2 or autoscaling config
+            config (Union[Dict[str, Union[str, int]], str]): The recommended ec2 or autoscaling config,
+                either as a dict or already formatted as "param: value" lines
+                (see AWSConfig.display_string - avoids re-rendering an unchanged config)
             config_type (str, optional): The type of config. Defaults to "EC2". Options in current setup are "EC2" and "AutoScaling"
 
         Returns:
@@ -40,9 +42,12 @@ class UserInterface:
 
         self.log_to_user(f"\nRecommended optimized {config_type} config:")
 
-        config_string = "\n".join(
-            f"{param}: {value}" for param, value in config.items()
-        )
+        if isinstance(config, str):
+            config_string = config
+        else:
+            config_string = "\n".join(
+                f"{param}: {value}" for param, value in config.items()
+            )
 
         self.log_to_user(config_string)
 
@@ -56,7 +61,7 @@ class UserInterface:
         """
 
         user_query = input("User: ")
-        logger.info(f"User: {user_query}")
+        logger.info("User: %s", user_query)
 
         return user_query
 
@@ -72,7 +77,7 @@ class UserInterface:
             None
         """
 
-        logger.info("Agent: " + text)
+        logger.info("Agent: %s", text)
 
         # simple logging for example
         print(text)
@@ -1,12 +1,31 @@
 from typing import Callable, Dict, Any
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import sys
+import time
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
+from threading import Lock
+
+import config
+
+# keeps the background log listener alive for the process lifetime
+_log_listener = None
 
 
 def setup_logger(logger_name: str = "aws_agent_logger") -> logging.Logger:
     """
     Creates basic backend logger that logs to a local file.
 
+    Logging callers only enqueue records; the actual formatting, file writes,
+    and rotation happen on a background QueueListener thread, keeping disk I/O
+    off the per-turn critical path.
+
     Args:
         logger_name (str): The name of the logger to be created.
 
@@ -14,21 +33,111 @@ def setup_logger(logger_name: str = "aws_agent_logger") -> logging.Logger:
         logging.Logger: The created logger.
     """
 
+    global _log_listener
+
     logger = logging.getLogger(logger_name)
-    logger.setLevel(logging.DEBUG)
+    # an effective level above DEBUG means deferred %-style log arguments are
+    # never formatted for the verbose payload logs
+    logger.setLevel(config.LOG_LEVEL)
 
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
     log_file = "app.log"
-    file_handler = RotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=5)
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=config.LOG_MAX_BYTES, backupCount=5
+    )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # batch records in memory in front of the file handler so the listener
+    # thread writes in LOG_BUFFER_CAPACITY-sized bursts instead of per record;
+    # anything at ERROR or above flushes the buffer immediately, and
+    # flushOnClose drains it at listener shutdown
+    buffered_handler = MemoryHandler(
+        capacity=config.LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
+    # callers hit only the in-memory queue; the listener thread owns the file handler
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    _log_listener = QueueListener(
+        log_queue, buffered_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+
+    listener = _log_listener
+
+    def _shutdown_logging():
+        # drain the queue into the memory buffer, then close it - stopping the
+        # listener alone leaves buffered records unwritten since it never
+        # closes its handlers
+        if listener._thread is not None:
+            listener.stop()
+        buffered_handler.close()
+
+    atexit.register(_shutdown_logging)
 
     return logger
 
 
+class BufferedLogger:
+    """
+    Drop-in replacement for print as a logging_function that buffers messages
+    and flushes them in batches.
+
+    print flushes stdout after every call, so chatty paths (deploys plus the
+    log-streaming loop) pay one write() syscall per message. Buffering
+    coalesces messages and flushes on a timer, which matters most when output
+    is piped to a slow consumer. A flush is registered at exit so nothing is
+    lost on shutdown.
+
+    Args:
+        stream: The stream to write to. Defaults to sys.stdout.
+        flush_every (float): Maximum seconds between flushes. Defaults to 0.25.
+    """
+
+    def __init__(self, stream=sys.stdout, flush_every: float = 0.25):
+        self.stream = stream
+        self.flush_every = flush_every
+
+        self._buf = []
+        self._last_flush = time.monotonic()
+        # streaming worker threads may log concurrently
+        self._lock = Lock()
+
+        atexit.register(self.flush)
+
+    def __call__(self, msg):
+        with self._lock:
+            self._buf.append(str(msg))
+            if time.monotonic() - self._last_flush >= self.flush_every:
+                self._flush_buffered()
+
+    def flush(self):
+        """
+        Write out anything still buffered.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._flush_buffered()
+
+    def _flush_buffered(self):
+        # caller must hold self._lock
+        if self._buf:
+            self.stream.write("\n".join(self._buf) + "\n")
+            self._buf.clear()
+            self.stream.flush()
+        self._last_flush = time.monotonic()
+
+
 def call_function(function_data: Dict[str, Any]) -> Any:
     """
     Currently unused - all intents currently feeding kwargs directly into associated functions.
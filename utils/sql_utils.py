@@ -1,57 +1,168 @@
+import functools
 import sqlite3
-from contextlib import contextmanager
-from threading import Lock
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from threading import Lock, local
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
 import config
-from typing import Dict, Union
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    Connection subclass used as the connect() factory - the base C type
+    rejects new attributes, and the pool needs a per-connection tuned flag
+    and a reusable cursor.
+    """
+
+    _tuned = False
+    _cursor = None
+
+    def pooled_cursor(self):
+        """
+        Return this connection's long-lived cursor.
+
+        Allocating a cursor per request is avoidable overhead - queries on a
+        pooled connection are serialized by checkout, so one cursor suffices.
+
+        Returns:
+            sqlite3.Cursor: The reusable cursor.
+        """
+
+        if self._cursor is None:
+            self._cursor = self.cursor()
+        return self._cursor
 
 
 class SQLiteConnectionPool:
     """
-    Initialize the object with a database and a maximum number of connections.
+    Hands out one warm, tuned connection per thread.
+
+    SQLite under WAL supports many concurrent readers, so there's no need to
+    funnel every borrow through a shared lock and list - each worker thread
+    keeps its own connection (with its statement cache and page cache) for
+    its lifetime. One connection exists per thread that touches the pool, so
+    the connection count tracks the thread pool size.
+
+    Reads and writes are split: thread-local connections open the database
+    read-only (so a misrouted write fails loudly and readers never block
+    behind the writer under WAL), while writes go through a single shared
+    writer connection serialized by a lock - SQLite allows one writer at a
+    time anyway, so a userspace mutex beats busy-waiting on the file lock.
 
     Args:
-        database (str): The database to connect to.
-        max_connections (int): The maximum number of connections allowed.
+        database (str): The database to connect to. Must already exist on
+            disk for read-only connections (main.py loads it before building
+            the pool); :memory: databases skip the read-only split.
+        max_connections (int): Retained for API compatibility - sizing now
+            follows the number of threads using the pool.
     """
 
     def __init__(self, database: str, max_connections: int = 5):
         self.database = database
         self.max_connections = max_connections
-        self.connections = []
-        self.lock = Lock()
+        self._tls = local()
+        self._writer_lock = Lock()
+        self._writer_conn = None
+
+    def _tune_connection(self, conn, read_only: bool = False):
+        """
+        Apply performance PRAGMAs to a freshly opened connection.
+
+        WAL lets find_best_instance reads proceed concurrently with CSV loads
+        instead of serializing behind the writer, and synchronous=NORMAL drops
+        the per-commit fsync that dominates this I/O-bound path. Runs once per
+        physical connection - reused connections carry a flag and skip it.
+
+        Args:
+            conn (sqlite3.Connection): The connection to tune.
+            read_only (bool): Skip the journal-mode PRAGMAs, which require
+                write access - the writer already put the database in WAL.
+
+        Returns:
+            sqlite3.Connection: The tuned connection.
+        """
+
+        if getattr(conn, "_tuned", False):
+            return conn
+
+        # name-indexed rows built in C - callers get dict(row) in one call
+        # instead of zipping cursor.description per result
+        conn.row_factory = sqlite3.Row
+
+        # WAL/synchronous are writer-side settings, and meaningless for
+        # transient in-memory databases
+        if self.database != ":memory:" and not read_only:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # negative cache_size is KB -> 64MB page cache
+        conn.execute("PRAGMA cache_size=-65536")
+
+        if not read_only:
+            # once per connection lifetime: incrementally re-analyze whatever
+            # the planner flags as stale (no-op when stats are fresh). Readers
+            # skip it - optimize writes sqlite_stat1, which needs write access
+            conn.execute("PRAGMA optimize")
+
+        if self.database != ":memory:":
+            # memory-map the database file (up to 256MB) - page reads become
+            # direct RAM access through the OS page cache instead of read()
+            # syscalls into SQLite's own pager buffer. The catalog is small
+            # read-mostly reference data, so after first touch every query is
+            # served from memory
+            conn.execute("PRAGMA mmap_size=268435456")
+
+        conn._tuned = True
+        return conn
 
     def get_connection(self):
         """
-        Get a connection from the pool.
+        Get the calling thread's connection, creating it on first use.
 
         Returns:
-            sqlite3.Connection: A connection from the pool.
+            sqlite3.Connection: The thread's warm connection.
         """
 
-        with self.lock:
-            if self.connections:
-                return self.connections.pop()
-            else:
-                return sqlite3.connect(self.database)
+        # lock-free borrow: thread-local lookup instead of a shared queue -
+        # even queue.SimpleQueue takes an internal lock per get/put, and with
+        # one connection per thread there is nothing to hand back and forth
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            read_only = self.database != ":memory:"
+            target = (
+                f"file:{self.database}?mode=ro" if read_only else self.database
+            )
+            # cached_statements raised from the default 128 so repeated
+            # queries skip the SQLite parser/code-generator on re-execution
+            conn = self._tune_connection(
+                sqlite3.connect(
+                    target,
+                    uri=read_only,
+                    factory=_PooledConnection,
+                    cached_statements=256,
+                ),
+                read_only=read_only,
+            )
+            self._tls.conn = conn
+        return conn
 
     def return_connection(self, connection):
         """
-        Return a connection to the pool.
+        No-op retained for API compatibility - thread-local connections stay
+        open and warm for the thread's lifetime.
 
         Args:
-            connection (sqlite3.Connection): The connection to return.
+            connection (sqlite3.Connection): The connection being released.
 
         Returns:
             None
         """
 
-        with self.lock:
-            if len(self.connections) < self.max_connections:
-                self.connections.append(connection)
-            else:
-                connection.close()
-
     @contextmanager
     def connection(self):
         """
@@ -64,30 +175,391 @@ class SQLiteConnectionPool:
         finally:
             self.return_connection(conn)
 
+    def warmup(self, table_name: str = "ec2_rec"):
+        """
+        Pre-open the calling thread's connection and touch the hot table.
+
+        Moves the connect()+PRAGMA latency and the first page-in of the index
+        root off the request path and into startup. Connections are
+        thread-local, so each worker thread that wants a warm start should
+        call this once; a missing table is ignored (nothing to page in yet).
+
+        Args:
+            table_name (str): The table to touch (default "ec2_rec").
+
+        Returns:
+            None
+        """
+
+        conn = self.get_connection()
+        try:
+            conn.execute(f'SELECT 1 FROM "{table_name}" LIMIT 1').fetchone()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def writer(self):
+        """
+        A context manager that yields the shared writer connection, serialized
+        by the writer lock.
+
+        Opened with check_same_thread=False since any thread may take the
+        lock; the lock guarantees single-threaded use at a time.
+        """
+
+        with self._writer_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self._tune_connection(
+                    sqlite3.connect(
+                        self.database,
+                        factory=_PooledConnection,
+                        cached_statements=256,
+                        check_same_thread=False,
+                    )
+                )
+            yield self._writer_conn
+
+
+# single worker for background CSV ingests - sqlite3's C layer releases the
+# GIL inside executemany, so a load on this thread overlaps with readers
+# serving find_best_instance; one worker keeps loads naturally serialized
+_load_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sql_load")
+
+
+# in-memory copy of the catalog, sorted by On_Demand ascending - for a few
+# hundred rows a NumPy mask over contiguous arrays beats running SQLite's
+# VDBE interpreter per query. Populated by the CSV load; None until then,
+# in which case lookups fall back to SQL
+_catalog_df = None
+
+# the filter columns of _catalog_df pre-extracted as contiguous float arrays
+# (same price-sorted row order) - per-query work is then two compares, an
+# AND, and an argmax over cache-friendly memory, with no pandas dispatch
+_catalog_cols = None
+
+
+def _sqlite_column_type(dtype) -> str:
+    """
+    Map a pandas dtype to the SQLite column type used for the load.
+
+    Args:
+        dtype: The pandas dtype of a CSV column.
+
+    Returns:
+        str: "INTEGER", "REAL", or "TEXT".
+    """
+
+    if pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
 
 def create_sql_db_from_csv(
-        csv_path: str, db_path: str = "ec2.db", table_name: str = "ec2_rec"
-):
+        csv_path: str,
+        db_path: str = "ec2.db",
+        table_name: str = "ec2_rec",
+        chunksize: int = 50_000,
+        background: bool = False,
+) -> Optional[Future]:
     """
     Create a SQLite database from a CSV file.
 
+    Streams the CSV in chunks through cursor.executemany inside one explicit
+    transaction rather than pandas to_sql - to_sql binds rows one at a time
+    and pays per-statement transaction overhead, which dominates bulk-import
+    time. A single BEGIN...COMMIT amortizes the fsync across the whole load,
+    and peak memory for the insert path is O(chunksize) rather than O(rows).
+
     Args:
         csv_path (str): The file path to the CSV file.
         db_path (str): The file path to the SQLite database (default is "ec2.db").
         table_name (str): The name of the table to be created in the database (default is "ec2_rec").
+        chunksize (int): Rows per read/insert batch (default 50,000) - lower
+            it to cap the loader's memory footprint on large catalogs.
+        background (bool): Run the load on the ingest worker thread and return
+            a Future instead of blocking. sqlite3 releases the GIL during
+            executemany, so readers keep serving against the old table (WAL)
+            while the load runs. Callers must wait on the Future before
+            relying on the new data.
+
+    Returns:
+        Optional[Future]: The pending load when background=True, else None.
+    """
+
+    # the load is the write path - if a pool already serves this database,
+    # serialize against its writer so readers (never blocked under WAL) see
+    # either the old or the fully loaded table, and concurrent writers queue
+    pool = config.sql_ec2_connection_pool
+    write_guard = (
+        pool._writer_lock
+        if pool is not None and pool.database == db_path
+        else nullcontext()
+    )
+
+    # isolation_level=None -> manual transaction control; synchronous=OFF is
+    # safe here because the table is rebuilt from the CSV on every startup
+    def _run():
+        # leaving WAL for the load-time memory journal requires exclusive
+        # access to the database file, so only do it when no pool (and thus
+        # no reader) is attached yet - the startup path in main.py
+        with write_guard:
+            _bulk_load_csv(
+                csv_path,
+                db_path,
+                table_name,
+                exclusive=isinstance(write_guard, nullcontext),
+                chunksize=chunksize,
+            )
+
+        # memoized best-instance results are stale once the table is rebuilt
+        _query_best_instance.cache_clear()
+
+    if background:
+        return _load_executor.submit(_run)
+
+    _run()
+    return None
+
+
+def _bulk_load_csv(
+        csv_path: str,
+        db_path: str,
+        table_name: str,
+        exclusive: bool = True,
+        chunksize: int = 50_000,
+):
+    """
+    Perform the chunked CSV load on a dedicated connection.
+
+    Split out of create_sql_db_from_csv so the writer-lock scoping stays
+    readable; the load connection is private because it needs
+    isolation_level=None and load-time PRAGMAs.
+
+    Args:
+        csv_path (str): The file path to the CSV file.
+        db_path (str): The file path to the SQLite database.
+        table_name (str): The destination table name.
+        exclusive (bool): Whether this loader is the only connection to the
+            database, enabling the memory-journal/exclusive-lock fast modes.
+            Reloads with live readers must stay in WAL.
+        chunksize (int): Rows per read/insert batch.
 
     Returns:
         None
     """
 
-    conn = sqlite3.connect(db_path)
-    df = pd.read_csv(csv_path)
-    df.to_sql(table_name, conn, if_exists="replace", index=False)
+    global _catalog_df, _catalog_cols
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        # load-time settings: no durability barriers (the db is rebuilt from
+        # the CSV on failure), journal kept in RAM, the file locked once for
+        # the whole load instead of per-transaction, and a 128MB page cache
+        # for the rebuild/index passes. WAL+NORMAL are restored at the end
+        # for the steady-state readers
+        conn.execute("PRAGMA synchronous=OFF")
+        if exclusive:
+            # 8KB pages (default 4KB) halve B-tree depth for the catalog, so
+            # lookups touch fewer pages; on a fresh file the setting applies
+            # on first write, and VACUUM rebuilds a pre-existing file onto
+            # the new size. Requires exclusive access, like the mode switches
+            conn.execute("PRAGMA page_size=8192")
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        else:
+            # live readers exist - WAL is the only mode that lets them keep
+            # reading while this load writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA cache_size=-131072")
+
+        insert_sql = None
+        loaded_columns = ()
+        column_defs = None
+        chunks = []
+        conn.execute("BEGIN")
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            # rows without a price can never be recommended - dropping them
+            # here keeps NULL tests out of every later query and index
+            if "On_Demand" in chunk.columns:
+                chunk = chunk.dropna(subset=["On_Demand"])
+            chunks.append(chunk)
+            if insert_sql is None:
+                loaded_columns = tuple(chunk.columns)
+                # first chunk defines the schema (mirrors to_sql's "replace")
+                column_defs = ", ".join(
+                    f'"{name}" {_sqlite_column_type(dtype)}'
+                    for name, dtype in chunk.dtypes.items()
+                )
+                conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+                conn.execute(f'CREATE TABLE "{table_name}" ({column_defs})')
+
+                # one-row statement executed via executemany: sqlite3 compiles
+                # it once and loops binding in C, which matches multi-row
+                # VALUES batching without bumping into SQLite's bound-parameter
+                # limit (999 params would cap batches at 999//len(columns) rows)
+                placeholders = ", ".join("?" * len(chunk.columns))
+                insert_sql = f'INSERT INTO "{table_name}" VALUES ({placeholders})'
+
+            conn.executemany(insert_sql, chunk.itertuples(index=False, name=None))
+        conn.execute("COMMIT")
+
+        # the find_best_instance query orders by On_Demand with >= filters on
+        # vCPUs/Instance_Memory - without an index SQLite scans and sorts the
+        # whole table per call. The partial index walks prices in order and
+        # stops at the first qualifying row; the composite index covers the
+        # filter columns so the probe never touches the table
+        if {"On_Demand", "vCPUs", "Instance_Memory"} <= set(loaded_columns):
+            # rebuild the table ordered by On_Demand so the hot ORDER BY ...
+            # LIMIT 1 scan reads a sequential page prefix instead of hopping
+            # B-tree pages in CSV insertion order (NULL-priced rows were
+            # already dropped at read time)
+            conn.execute("BEGIN")
+            conn.execute(f'DROP TABLE IF EXISTS "{table_name}_sorted"')
+
+            without_rowid = "API_Name" in loaded_columns
+            if without_rowid:
+                # WITHOUT ROWID keyed on the sort order makes the table's own
+                # B-tree the price index - one tree instead of table+index,
+                # half the pages touched on the hot walk. API_Name breaks
+                # ties: the price/cpu/memory triple alone isn't unique
+                conn.execute(
+                    f'CREATE TABLE "{table_name}_sorted" ({column_defs}, '
+                    'PRIMARY KEY (On_Demand, vCPUs, Instance_Memory, "API_Name")'
+                    ") WITHOUT ROWID"
+                )
+                conn.execute(
+                    f'INSERT INTO "{table_name}_sorted" '
+                    f'SELECT * FROM "{table_name}" ORDER BY On_Demand'
+                )
+            else:
+                conn.execute(
+                    f'CREATE TABLE "{table_name}_sorted" AS '
+                    f'SELECT * FROM "{table_name}" ORDER BY On_Demand'
+                )
+
+            conn.execute(f'DROP TABLE "{table_name}"')
+            conn.execute(
+                f'ALTER TABLE "{table_name}_sorted" RENAME TO "{table_name}"'
+            )
+            conn.execute("COMMIT")
+
+            if not without_rowid:
+                # plain index now that the table holds no NULL prices; on the
+                # WITHOUT ROWID layout the primary key already serves this role
+                conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_ec2_ondemand ON "{table_name}"'
+                    "(On_Demand)"
+                )
+            conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_ec2_cpu_mem ON "{table_name}"'
+                "(vCPUs, Instance_Memory, On_Demand)"
+            )
+            # give the planner selectivity stats so it picks between the trees,
+            # then let SQLite trim/refresh whatever it judges stale
+            conn.execute("ANALYZE")
+            conn.execute("PRAGMA optimize")
+
+            # refresh the in-memory catalog the vectorized lookup path scans -
+            # pre-sorted by price so the first mask hit is the cheapest match
+            _catalog_df = (
+                pd.concat(chunks, ignore_index=True)
+                .sort_values("On_Demand", kind="mergesort")
+                .reset_index(drop=True)
+            )
+            _catalog_cols = (
+                np.ascontiguousarray(_catalog_df["vCPUs"].to_numpy(dtype=np.float64)),
+                np.ascontiguousarray(
+                    _catalog_df["Instance_Memory"].to_numpy(dtype=np.float64)
+                ),
+            )
+
+        # hand the database back in reader-friendly steady-state modes
+        if exclusive:
+            conn.execute("PRAGMA locking_mode=NORMAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        conn.close()
+
+
+@functools.lru_cache(maxsize=256)
+def _query_best_instance(cpu: int, ram: float) -> Mapping[str, Union[str, bool]]:
+    """
+    Execute the best-instance query and memoize the result.
+
+    The catalog only changes when the CSV reloads, and sessions revisit a
+    small set of (cpu, ram) pairs, so repeated calls become a dict lookup
+    instead of a SQLite round-trip. The cached mapping is read-only so one
+    caller can't mutate what later callers see; database errors propagate
+    (lru_cache doesn't cache exceptions) and are handled by the wrapper.
+
+    When the in-memory catalog is loaded, cache misses are answered by a
+    vectorized NumPy scan over it - a boolean mask on contiguous arrays with
+    an argmax early-out on the price-sorted frame, no VDBE interpretation.
+    The SQL path remains for processes that query an existing database
+    without having run the CSV load.
+
+    Args:
+        cpu (int): The CPU requirement in vCPUs.
+        ram (float): The RAM requirement in GB, pre-rounded by the caller.
+
+    Returns:
+        Mapping[str, Union[str, bool]]: Immutable best-instance details.
+    """
+
+    df = _catalog_df
+    if df is not None:
+        # NULL-priced rows are dropped at load time, so two range tests over
+        # the pre-extracted contiguous columns suffice
+        vcpus, memory = _catalog_cols
+        mask = (vcpus >= cpu) & (memory >= ram)
+        if mask.any():
+            # frame is sorted by On_Demand, so the first hit is the cheapest
+            result = df.iloc[int(mask.argmax())].to_dict()
+            result["found"] = True
+        else:
+            result = {
+                "found": False,
+                "message": f"No instance found with CPU >= {cpu}, RAM >= {ram}",
+            }
+        return MappingProxyType(result)
+
+    # no NULL test needed - the loader drops unpriced rows before insert
+    query = """
+    SELECT *
+    FROM ec2_rec
+    WHERE vCPUs >= ? AND Instance_Memory >= ?
+    ORDER BY On_Demand ASC
+    LIMIT 1
+    """
+
+    # AND GPU >= ? - doesn't exist in sample table found online
+
+    with config.sql_ec2_connection_pool.connection() as conn:
+        # pooled connections carry a reusable cursor; the prepared form of
+        # this query stays in the connection's statement cache across calls
+        cursor = conn.pooled_cursor()
+        cursor.execute(query, (cpu, ram))
+        row = cursor.fetchone()
+        if row:
+            # sqlite3.Row factory on pooled connections - direct dict conversion
+            result = dict(row)
+            result["found"] = True
+        else:
+            result = {
+                "found": False,
+                "message": f"No instance found with CPU >= {cpu}, RAM >= {ram}",
+            }
+        return MappingProxyType(result)
 
 
 def find_best_instance(
         cpu: int = config.DEFAULT_CPU, ram: float = config.DEFAULT_RAM
-) -> Dict[str, Union[str, bool]]:
+) -> Mapping[str, Union[str, bool]]:
     """
     Find the best instance based on CPU and RAM requirements.
     Assumption - inputs in GB
@@ -98,39 +570,97 @@ def find_best_instance(
     Given business case of problem is to determine optimal infrastructure for EC2 while being extensible to other deployment types,
     Text2SQL approach seems overboard in current state as much more prone to error.
 
+    Results are memoized per (cpu, ram) pair until the next CSV load; ram is
+    rounded to 0.1 GB so near-duplicate floats share a cache entry.
+
     Args:
         cpu (int): The CPU requirement in vCPUs.
         ram (float): The RAM requirement in GB.
 
     Returns:
-        Dict[str, Union[str, bool]: A dictionary containing the best instance details.
+        Mapping[str, Union[str, bool]]: A read-only mapping containing the best instance details.
     """
 
-    query = """
-    SELECT *
-    FROM ec2_rec
-    WHERE vCPUs >= ? AND Instance_Memory >= ? AND On_Demand IS NOT NULL
-    ORDER BY On_Demand ASC
-    LIMIT 1
+    try:
+        return _query_best_instance(cpu, round(float(ram), 1))
+    except sqlite3.Error as e:
+        return {"found": False, "message": f"Database error occurred: {str(e)}"}
+
+
+def find_best_instances(
+        requests: List[Tuple[int, float]]
+) -> List[Mapping[str, Union[str, bool]]]:
     """
+    Find the best instance for several (cpu, ram) requirements at once.
 
-    # AND GPU >= ? - doesn't exist in sample table found online
+    With the in-memory catalog loaded each lookup is already a microsecond
+    vector scan (and shares the memoization cache), so the batch simply maps
+    over it. On the SQL fallback the pairs are joined against ec2_rec in one
+    VALUES-table query, amortizing the round-trip, parse, and cursor cost
+    across the batch instead of paying them per pair.
+
+    Args:
+        requests (List[Tuple[int, float]]): (cpu, ram) requirement pairs.
+
+    Returns:
+        List[Mapping[str, Union[str, bool]]]: Best-instance details per pair,
+            in input order - same shape as find_best_instance results.
+    """
+
+    if not requests:
+        return []
+
+    if _catalog_df is not None:
+        return [find_best_instance(cpu, ram) for cpu, ram in requests]
+
+    # one round-trip: join the request pairs against the table and keep the
+    # cheapest match per pair (SQLite's bare-column MIN() selects the row the
+    # minimum came from); LEFT JOIN keeps pairs with no qualifying instance
+    values = ", ".join("(?, ?, ?)" for _ in requests)
+    query = f"""
+    WITH req(i, cpu, ram) AS (VALUES {values})
+    SELECT req.i AS req_i, req.cpu AS req_cpu, req.ram AS req_ram,
+           e.*, MIN(e.On_Demand) AS min_on_demand
+    FROM req
+    LEFT JOIN ec2_rec e
+        ON e.vCPUs >= req.cpu AND e.Instance_Memory >= req.ram
+    GROUP BY req.i
+    ORDER BY req.i
+    """
+    params = [
+        value
+        for index, (cpu, ram) in enumerate(requests)
+        for value in (index, cpu, round(float(ram), 1))
+    ]
 
     try:
         with config.sql_ec2_connection_pool.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, (cpu, ram))
-            row = cursor.fetchone()
-            if row:
-                columns = [column[0] for column in cursor.description]
-                result = dict(zip(columns, row))
-                result["found"] = True
-            else:
-                result = {
-                    "found": False,
-                    "message": f"No instance found with CPU >= {cpu}, RAM >= {ram}",
-                }
-            return result
+            cursor = conn.pooled_cursor()
+            cursor.execute(query, params)
+            results = []
+            for row in cursor.fetchall():
+                row = dict(row)
+                if row.pop("min_on_demand") is not None:
+                    cpu, ram = row.pop("req_cpu"), row.pop("req_ram")
+                    row.pop("req_i")
+                    row["found"] = True
+                    results.append(MappingProxyType(row))
+                else:
+                    results.append(
+                        MappingProxyType(
+                            {
+                                "found": False,
+                                "message": (
+                                    f"No instance found with CPU >= {row['req_cpu']}, "
+                                    f"RAM >= {row['req_ram']}"
+                                ),
+                            }
+                        )
+                    )
+            return results
 
     except sqlite3.Error as e:
-        return {"found": False, "message": f"Database error occurred: {str(e)}"}
+        error = MappingProxyType(
+            {"found": False, "message": f"Database error occurred: {str(e)}"}
+        )
+        return [error] * len(requests)